@@ -5,15 +5,36 @@
 
 """Font utilities using fontconfig."""
 
+import atexit
+import logging
+import mmap
+import multiprocessing
+import operator
+import os
 import subprocess
 import re
+import sqlite3
+import struct
+import threading
+import unicodedata
+import zlib
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 
 from fontTools.ttLib import TTFont
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+def normalize_search(text: str) -> str:
+    """Normalize *text* for case- and compatibility-insensitive matching."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+@dataclass(slots=True)
 class FontInfo:
     """Information about a font."""
 
@@ -24,6 +45,14 @@ class FontInfo:
     slant: str = ""
     width: str = ""
     favorite: bool = False
+    # Lower-cased family, the sort key of get_installed_fonts()
+    family_lower: str = field(init=False, repr=False, compare=False)
+    # normalize_search() of "family style", for matching search queries
+    search_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.family_lower = self.family.lower()
+        self.search_key = normalize_search(f"{self.family} {self.style}")
 
     @property
     def display_name(self) -> str:
@@ -32,36 +61,43 @@ class FontInfo:
         return self.family
 
 
-# Unicode blocks for coverage analysis
-UNICODE_BLOCKS = {
-    "Basic Latin": (0x0020, 0x007F),
-    "Latin-1 Supplement": (0x0080, 0x00FF),
-    "Latin Extended-A": (0x0100, 0x017F),
-    "Latin Extended-B": (0x0180, 0x024F),
-    "Cyrillic": (0x0400, 0x04FF),
-    "Greek and Coptic": (0x0370, 0x03FF),
-    "Arabic": (0x0600, 0x06FF),
-    "Devanagari": (0x0900, 0x097F),
-    "CJK Unified Ideographs": (0x4E00, 0x9FFF),
-    "Hiragana": (0x3040, 0x309F),
-    "Katakana": (0x30A0, 0x30FF),
-    "Hangul Syllables": (0xAC00, 0xD7AF),
-    "Thai": (0x0E00, 0x0E7F),
-    "Georgian": (0x10A0, 0x10FF),
-    "Armenian": (0x0530, 0x058F),
-    "Hebrew": (0x0590, 0x05FF),
-    "Ethiopic": (0x1200, 0x137F),
-    "Mathematical Operators": (0x2200, 0x22FF),
-    "Box Drawing": (0x2500, 0x257F),
-    "Currency Symbols": (0x20A0, 0x20CF),
-    "General Punctuation": (0x2000, 0x206F),
-    "Arrows": (0x2190, 0x21FF),
-    "Dingbats": (0x2700, 0x27BF),
-    "Emoticons": (0x1F600, 0x1F64F),
-}
+# Unicode blocks for coverage analysis, as (name, first, last) codepoint
+_BLOCKS = (
+    ("Basic Latin", 0x0020, 0x007F),
+    ("Latin-1 Supplement", 0x0080, 0x00FF),
+    ("Latin Extended-A", 0x0100, 0x017F),
+    ("Latin Extended-B", 0x0180, 0x024F),
+    ("Cyrillic", 0x0400, 0x04FF),
+    ("Greek and Coptic", 0x0370, 0x03FF),
+    ("Arabic", 0x0600, 0x06FF),
+    ("Devanagari", 0x0900, 0x097F),
+    ("CJK Unified Ideographs", 0x4E00, 0x9FFF),
+    ("Hiragana", 0x3040, 0x309F),
+    ("Katakana", 0x30A0, 0x30FF),
+    ("Hangul Syllables", 0xAC00, 0xD7AF),
+    ("Thai", 0x0E00, 0x0E7F),
+    ("Georgian", 0x10A0, 0x10FF),
+    ("Armenian", 0x0530, 0x058F),
+    ("Hebrew", 0x0590, 0x05FF),
+    ("Ethiopic", 0x1200, 0x137F),
+    ("Mathematical Operators", 0x2200, 0x22FF),
+    ("Box Drawing", 0x2500, 0x257F),
+    ("Currency Symbols", 0x20A0, 0x20CF),
+    ("General Punctuation", 0x2000, 0x206F),
+    ("Arrows", 0x2190, 0x21FF),
+    ("Dingbats", 0x2700, 0x27BF),
+    ("Emoticons", 0x1F600, 0x1F64F),
+)
+
+# Parallel columns of _BLOCKS for tight numeric loops
+BLOCK_NAMES = tuple(name for name, _start, _end in _BLOCKS)
+BLOCK_STARTS = array("I", (start for _name, start, _end in _BLOCKS))
+BLOCK_ENDS = array("I", (end for _name, _start, end in _BLOCKS))
+
+UNICODE_BLOCKS = MappingProxyType({name: (start, end) for name, start, end in _BLOCKS})
 
 # Language-specific character sets for coverage testing
-LANGUAGE_CHARS = {
+LANGUAGE_CHARS = MappingProxyType({
     "Swedish": "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZzÅåÄäÖö",
     "Norwegian": "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZzÆæØøÅå",
     "Danish": "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZzÆæØøÅå",
@@ -79,88 +115,574 @@ LANGUAGE_CHARS = {
     "Hebrew": "אבגדהוזחטיכלמנסעפצקרשת",
     "Thai": "กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรลวศษสหฬอฮ",
     "Vietnamese": "AaĂăÂâBbCcDdĐđEeÊêGgHhIiKkLlMmNnOoÔôƠơPpQqRrSsTtUuƯưVvXxYy",
-}
+})
+
+# The unique codepoints of each LANGUAGE_CHARS entry, in ascending order
+LANGUAGE_CP = MappingProxyType({
+    lang: tuple(sorted(set(map(ord, chars)))) for lang, chars in LANGUAGE_CHARS.items()
+})
+
+
+_FC_FORMAT = "%{family}\t%{style}\t%{file}\n"
+_FC_FORMAT_DETAILS = "%{family}\t%{style}\t%{file}\t%{weight}\t%{slant}\t%{width}\n"
+# Bitmap-only formats that cannot be previewed at arbitrary sizes
+_BITMAP_FONT_SUFFIXES = (b".pcf", b".pcf.gz", b".bdf", b".fon")
+
+_XDG_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+_XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+# Where font-preview keeps its caches
+CACHE_DIR = os.path.join(_XDG_CACHE_HOME, "font-preview")
+
+# fontconfig's configuration, its caches (rewritten whenever fc-cache picks
+# up added or removed fonts) and the usual font directories
+_FONTCONFIG_STAMP_PATHS = (
+    "/etc/fonts/fonts.conf",
+    "/etc/fonts/conf.d",
+    os.path.join(_XDG_CONFIG_HOME, "fontconfig"),
+    "/var/cache/fontconfig",
+    os.path.join(_XDG_CACHE_HOME, "fontconfig"),
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+)
+
+def fontconfig_stamp() -> tuple[int, ...]:
+    """Get the mtimes of fontconfig's configuration, cache and font dirs.
+
+    The stamp changes whenever the set of installed fonts may have changed.
+    """
+    stamp = []
+    for path in _FONTCONFIG_STAMP_PATHS:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
 
 
-def get_installed_fonts() -> list[FontInfo]:
-    """Get all installed fonts via fc-list."""
+def get_installed_fonts(details: bool = False) -> list[FontInfo]:
+    """Get all installed fonts via fc-list.
+
+    Only family, style and file are queried unless *details* is true; see
+    get_font_details() for a single font's weight, slant and width.  The
+    output is parsed line by line as fc-list produces it.
+    """
     try:
-        result = subprocess.run(
-            ["fc-list", "--format", "%{family}|%{style}|%{file}|%{weight}|%{slant}|%{width}\n"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        proc = subprocess.Popen(
+            # Not :outline=true, which also drops colour bitmap (CBDT/sbix)
+            # fonts such as Noto Color Emoji
+            ["fc-list", ":scalable=true", "--format",
+             _FC_FORMAT_DETAILS if details else _FC_FORMAT],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except OSError:
         return []
+    # Don't let a hanging fc-list block the loader thread forever
+    watchdog = threading.Timer(30, proc.kill)
+    watchdog.start()
 
     fonts = []
     seen = set()
-    for line in result.stdout.strip().split("\n"):
-        if not line.strip():
+    skipped = 0
+    try:
+        with proc.stdout:
+            for raw in proc.stdout:
+                # Repeated records are byte-identical lines; drop them
+                # before splitting so they cost a single hash
+                if raw in seen:
+                    continue
+                seen.add(raw)
+                parts = raw.rstrip(b"\n").split(b"\t", 5)
+                if len(parts) < 3:
+                    continue
+                if parts[2].lower().endswith(_BITMAP_FONT_SUFFIXES):
+                    skipped += 1
+                    continue
+
+                weight, slant, width = (parts + [b"", b"", b""])[3:6]
+                fonts.append(FontInfo(
+                    family=parts[0].split(b",", 1)[0].decode("utf-8", "replace"),
+                    style=parts[1].split(b",", 1)[0].decode("utf-8", "replace"),
+                    path=os.fsdecode(parts[2]),
+                    weight=weight.decode("ascii", "replace"),
+                    slant=slant.decode("ascii", "replace"),
+                    width=width.decode("ascii", "replace"),
+                ))
+    finally:
+        watchdog.cancel()
+        proc.wait()
+
+    # Killed by the watchdog or failed: what was read is only part of the list
+    if proc.returncode != 0:
+        logger.warning("fc-list exited with status %d", proc.returncode)
+        return []
+
+    logger.debug("fc-list: %d fonts, %d bitmap fonts skipped", len(fonts), skipped)
+    fonts.sort(key=operator.attrgetter("family_lower"))
+    return fonts
+
+
+def get_installed_fonts_async(details: bool = False) -> Future:
+    """Run get_installed_fonts() in a child process.
+
+    Returns a Future for the font list, so parsing fc-list's output never
+    holds the caller's GIL.
+    """
+    ex = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        return ex.submit(get_installed_fonts, details)
+    finally:
+        ex.shutdown(wait=False)
+
+
+def get_font_details(font_path: str, style: str = "") -> tuple[str, str, str]:
+    """Get (weight, slant, width) of a font file via fc-query.
+
+    In a font collection the face named *style* is used, else the first.
+    """
+    try:
+        result = subprocess.run(
+            ["fc-query", "--format", "%{style}\t%{weight}\t%{slant}\t%{width}\n", font_path],
+            capture_output=True,
+            timeout=10,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return "", "", ""
+
+    faces = {}
+    for line in result.stdout.splitlines():
+        parts = line.split(b"\t")
+        if len(parts) != 4:
             continue
-        parts = line.split("|")
-        if len(parts) < 3:
+        face_style = parts[0].split(b",", 1)[0].decode("utf-8", "replace")
+        faces.setdefault(face_style, tuple(p.decode("ascii", "replace") for p in parts[1:]))
+    if not faces:
+        return "", "", ""
+    return faces.get(style) or next(iter(faces.values()))
+
+
+# cmap subtables in the order fontTools' getBestCmap() prefers them
+CMAP_PREFERENCES = ((3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0))
+
+
+def _read_cmap_ranges(font_path: str) -> Optional[list[tuple[int, int]]]:
+    """Read the codepoint ranges of a font's best cmap subtable.
+
+    Only the sfnt table directory and the cmap table are touched; codepoints
+    mapped to glyph 0 (.notdef) are left out.  Returns None when the file
+    is not a plain sfnt (or collection) or the best subtable has a format
+    not handled here, so the caller can fall back to fontTools.
+    """
+    try:
+        with open(font_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _parse_cmap_ranges(data)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def _parse_cmap_ranges(data) -> Optional[list[tuple[int, int]]]:
+    sfnt = 0
+    if data[:4] == b"ttcf":
+        # Font collection: use the first face, like fc-list's index 0
+        (sfnt,) = struct.unpack_from(">I", data, 12)
+    if data[sfnt:sfnt + 4] not in (b"\x00\x01\x00\x00", b"OTTO", b"true"):
+        return None
+
+    (num_tables,) = struct.unpack_from(">H", data, sfnt + 4)
+    cmap = None
+    for i in range(num_tables):
+        tag, _checksum, offset, _length = struct.unpack_from(">4sIII", data, sfnt + 12 + i * 16)
+        if tag == b"cmap":
+            cmap = offset
+            break
+    if cmap is None:
+        return None
+
+    _version, num_subtables = struct.unpack_from(">HH", data, cmap)
+    subtables = {}
+    for i in range(num_subtables):
+        platform, encoding, offset = struct.unpack_from(">HHI", data, cmap + 4 + i * 8)
+        subtables.setdefault((platform, encoding), cmap + offset)
+    for key in CMAP_PREFERENCES:
+        if key in subtables:
+            offset = subtables[key]
+            break
+    else:
+        return []
+
+    (fmt,) = struct.unpack_from(">H", data, offset)
+    parser = _CMAP_PARSERS.get(fmt)
+    return parser(data, offset) if parser else None
+
+
+def _glyph_runs(first: int, glyphs) -> list[tuple[int, int]]:
+    """Group consecutive codepoints from *first* with a non-zero glyph into ranges."""
+    ranges = []
+    run_start = None
+    cp = first
+    for cp, glyph in enumerate(glyphs, first):
+        if glyph:
+            if run_start is None:
+                run_start = cp
+        elif run_start is not None:
+            ranges.append((run_start, cp - 1))
+            run_start = None
+    if run_start is not None:
+        ranges.append((run_start, cp))
+    return ranges
+
+
+def _parse_cmap_format0(data, offset: int) -> list[tuple[int, int]]:
+    return _glyph_runs(0, data[offset + 6:offset + 262])
+
+
+def _parse_cmap_format4(data, offset: int) -> list[tuple[int, int]]:
+    (seg_count_x2,) = struct.unpack_from(">H", data, offset + 6)
+    seg_count = seg_count_x2 // 2
+    end_codes = struct.unpack_from(f">{seg_count}H", data, offset + 14)
+    start_codes = struct.unpack_from(f">{seg_count}H", data, offset + 16 + seg_count_x2)
+    deltas = struct.unpack_from(f">{seg_count}h", data, offset + 16 + 2 * seg_count_x2)
+    range_offsets_pos = offset + 16 + 3 * seg_count_x2
+    range_offsets = struct.unpack_from(f">{seg_count}H", data, range_offsets_pos)
+
+    ranges = []
+    for i, (start, end, delta, range_offset) in enumerate(
+            zip(start_codes, end_codes, deltas, range_offsets)):
+        if start == 0xFFFF or end < start:
             continue
-        family = parts[0].split(",")[0].strip()
-        style = parts[1].split(",")[0].strip() if len(parts) > 1 else ""
-        path = parts[2].strip()
-        weight = parts[3].strip() if len(parts) > 3 else ""
-        slant = parts[4].strip() if len(parts) > 4 else ""
-        width = parts[5].strip() if len(parts) > 5 else ""
-
-        key = (family, style, path)
-        if key in seen:
+        if range_offset == 0:
+            # Glyph is (cp + delta) mod 65536; only one cp can hit .notdef
+            notdef = -delta & 0xFFFF
+            if start <= notdef <= end:
+                if start < notdef:
+                    ranges.append((start, notdef - 1))
+                if notdef < end:
+                    ranges.append((notdef + 1, end))
+            else:
+                ranges.append((start, end))
             continue
-        seen.add(key)
-
-        fonts.append(FontInfo(
-            family=family,
-            style=style,
-            path=path,
-            weight=weight,
-            slant=slant,
-            width=width,
-        ))
-
-    fonts.sort(key=lambda f: f.family.lower())
-    return fonts
+        glyphs = struct.unpack_from(
+            f">{end - start + 1}H", data, range_offsets_pos + i * 2 + range_offset
+        )
+        ranges.extend(_glyph_runs(start, (g and (g + delta) & 0xFFFF for g in glyphs)))
+    return ranges
 
 
-def get_font_coverage(font_path: str) -> set[int]:
-    """Get the set of Unicode codepoints supported by a font."""
+def _parse_cmap_format6(data, offset: int) -> list[tuple[int, int]]:
+    first, count = struct.unpack_from(">HH", data, offset + 6)
+    return _glyph_runs(first, struct.unpack_from(f">{count}H", data, offset + 10))
+
+
+def _parse_cmap_format10(data, offset: int) -> list[tuple[int, int]]:
+    first, count = struct.unpack_from(">II", data, offset + 12)
+    return _glyph_runs(first, struct.unpack_from(f">{count}H", data, offset + 20))
+
+
+def _parse_cmap_format12(data, offset: int) -> list[tuple[int, int]]:
+    (num_groups,) = struct.unpack_from(">I", data, offset + 12)
+    ranges = []
+    for start, end, _glyph in struct.iter_unpack(">III", data[offset + 16:offset + 16 + num_groups * 12]):
+        end = min(end, 0x10FFFF)
+        if start <= end:
+            ranges.append((start, end))
+    return ranges
+
+
+def _parse_cmap_format13(data, offset: int) -> list[tuple[int, int]]:
+    # Same layout as format 12, but every codepoint in a group maps to one glyph
+    (num_groups,) = struct.unpack_from(">I", data, offset + 12)
+    ranges = []
+    for start, end, glyph in struct.iter_unpack(">III", data[offset + 16:offset + 16 + num_groups * 12]):
+        end = min(end, 0x10FFFF)
+        if glyph and start <= end:
+            ranges.append((start, end))
+    return ranges
+
+
+_CMAP_PARSERS = {
+    0: _parse_cmap_format0,
+    4: _parse_cmap_format4,
+    6: _parse_cmap_format6,
+    10: _parse_cmap_format10,
+    12: _parse_cmap_format12,
+    13: _parse_cmap_format13,
+}
+
+
+def _set_bits(bitmap: bytearray, start: int, end: int):
+    first, last = start >> 3, end >> 3
+    head = (0xFF << (start & 7)) & 0xFF
+    tail = 0xFF >> (7 - (end & 7))
+    if first == last:
+        bitmap[first] |= head & tail
+        return
+    bitmap[first] |= head
+    bitmap[first + 1:last] = b"\xff" * (last - first - 1)
+    bitmap[last] |= tail
+
+
+def _bitmap_from_ranges(ranges) -> bytes:
+    """Build a codepoint bitmap (bit cp & 7 of byte cp >> 3) from ranges.
+
+    The bitmap is only as long as the highest codepoint requires.
+    """
+    if not ranges:
+        return b""
+    bitmap = bytearray((max(end for _start, end in ranges) >> 3) + 1)
+    for start, end in ranges:
+        _set_bits(bitmap, start, end)
+    return bytes(bitmap)
+
+
+def _read_coverage(font_path: str) -> bytes:
+    ranges = _read_cmap_ranges(font_path)
+    if ranges is not None:
+        return _bitmap_from_ranges(ranges)
+
     try:
-        tt = TTFont(font_path)
-        cmap = tt.getBestCmap()
+        # Only reached for fonts the sfnt reader can't handle, e.g. WOFF
+        with TTFont(font_path, lazy=True, recalcBBoxes=False, recalcTimestamp=False) as tt:
+            cmap = tt.getBestCmap()
         if cmap:
-            return set(cmap.keys())
+            return _bitmap_from_ranges([(cp, cp) for cp in cmap])
     except Exception:
         pass
-    return set()
+    return b""
+
+
+COVERAGE_CACHE_FILE = os.path.join(CACHE_DIR, "coverage.sqlite")
+_COVERAGE_CACHE_VERSION = 3
+# Stored bitmaps are committed in batches of this many
+_COVERAGE_COMMIT_EVERY = 64
+
+# Table cov: path -> (st_mtime_ns, st_size, zlib-compressed codepoint bitmap)
+_coverage_db: Optional[sqlite3.Connection] = None
+_coverage_db_opened = False
+_coverage_db_pending = 0
+_coverage_cache_lock = threading.Lock()
+
+
+def _open_coverage_db() -> Optional[sqlite3.Connection]:
+    try:
+        os.makedirs(os.path.dirname(COVERAGE_CACHE_FILE), exist_ok=True)
+        db = sqlite3.connect(COVERAGE_CACHE_FILE, check_same_thread=False)
+        if db.execute("PRAGMA user_version").fetchone()[0] != _COVERAGE_CACHE_VERSION:
+            db.execute("DROP TABLE IF EXISTS cov")
+            db.execute("CREATE TABLE cov (path TEXT PRIMARY KEY, mtime INTEGER,"
+                       " size INTEGER, bitmap BLOB)")
+            db.execute(f"PRAGMA user_version = {_COVERAGE_CACHE_VERSION}")
+            db.commit()
+        return db
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("Coverage cache unavailable: %s", e)
+        return None
+
+
+def _get_coverage_db() -> Optional[sqlite3.Connection]:
+    """Open the coverage cache on first use; call with the lock held."""
+    global _coverage_db, _coverage_db_opened
+    if not _coverage_db_opened:
+        _coverage_db = _open_coverage_db()
+        _coverage_db_opened = True
+    return _coverage_db
+
+
+@atexit.register
+def _save_coverage_cache():
+    global _coverage_db_pending
+    with _coverage_cache_lock:
+        if _coverage_db is None or not _coverage_db_pending:
+            return
+        try:
+            _coverage_db.commit()
+        except sqlite3.Error:
+            pass
+        _coverage_db_pending = 0
+
+
+def _cache_lookup(font_path: str, stamp: tuple[int, int]) -> Optional[bytes]:
+    with _coverage_cache_lock:
+        db = _get_coverage_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute("SELECT mtime, size, bitmap FROM cov WHERE path = ?",
+                             (font_path,)).fetchone()
+        except sqlite3.Error:
+            return None
+    if row is not None and row[:2] == stamp:
+        try:
+            return zlib.decompress(row[2])
+        except zlib.error:
+            pass
+    return None
+
 
+def _cached_stamps() -> dict[str, tuple[int, int]]:
+    """Get the (mtime, size) of every cached font, without its bitmap."""
+    with _coverage_cache_lock:
+        db = _get_coverage_db()
+        if db is None:
+            return {}
+        try:
+            rows = db.execute("SELECT path, mtime, size FROM cov").fetchall()
+        except sqlite3.Error:
+            return {}
+    return {path: (mtime, size) for path, mtime, size in rows}
 
-def get_block_coverage(supported: set[int], block_start: int, block_end: int) -> float:
-    """Get coverage percentage for a Unicode block."""
+
+def _cache_store(font_path: str, stamp: tuple[int, int], bitmap: bytes):
+    global _coverage_db_pending
+    data = zlib.compress(bitmap)
+    with _coverage_cache_lock:
+        db = _get_coverage_db()
+        if db is None:
+            return
+        try:
+            db.execute("INSERT OR REPLACE INTO cov VALUES (?, ?, ?, ?)",
+                       (font_path, *stamp, data))
+            _coverage_db_pending += 1
+            if _coverage_db_pending >= _COVERAGE_COMMIT_EVERY:
+                db.commit()
+                _coverage_db_pending = 0
+        except sqlite3.Error:
+            pass
+
+
+def _stat_stamp(font_path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(font_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def get_font_coverage(font_path: str) -> bytes:
+    """Get the Unicode codepoints supported by a font as a bitmap.
+
+    Codepoint cp is supported when bit cp & 7 of byte cp >> 3 is set;
+    codepoints past the end of the bitmap are unsupported.  Results are
+    cached on disk and reused while the file's mtime and size are unchanged.
+    """
+    stamp = _stat_stamp(font_path)
+    if stamp is None:
+        return b""
+    bitmap = _cache_lookup(font_path, stamp)
+    if bitmap is None:
+        bitmap = _read_coverage(font_path)
+        _cache_store(font_path, stamp, bitmap)
+    return bitmap
+
+
+# Set by cancel_prefetch() to stop prefetch_coverage() between batches
+_prefetch_stop = threading.Event()
+
+
+def cancel_prefetch():
+    """Make running prefetch_coverage() calls stop after their current batch."""
+    _prefetch_stop.set()
+
+
+def prefetch_coverage(font_paths):
+    """Fill the coverage cache for many fonts at once.
+
+    Fonts missing from the cache, or changed since, are read in a process
+    pool, one worker per CPU.  Cached bitmaps are not loaded.  Stops early
+    if cancel_prefetch() is called.
+    """
+    cached = _cached_stamps()
+    misses = {}
+    for path in font_paths:
+        if path in misses:
+            continue
+        stamp = _stat_stamp(path)
+        if stamp is not None and cached.get(path) != stamp:
+            misses[path] = stamp
+    if not misses:
+        return
+
+    # Spawned workers: forking a process that is running GTK threads is unsafe.
+    # Work is submitted in batches, so quitting only waits for the current one.
+    paths = list(misses)
+    workers = os.cpu_count() or 1
+    batch = workers * 8
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn")) as ex:
+        for i in range(0, len(paths), batch):
+            if _prefetch_stop.is_set():
+                break
+            chunk = paths[i:i + batch]
+            try:
+                bitmaps = ex.map(_read_coverage, chunk, chunksize=8)
+            except RuntimeError:
+                # The interpreter is shutting down
+                break
+            for path, bitmap in zip(chunk, bitmaps):
+                _cache_store(path, misses[path], bitmap)
+    _save_coverage_cache()
+
+
+def has_codepoint(bitmap: bytes, cp: int) -> bool:
+    """Check whether a coverage bitmap includes a codepoint."""
+    return cp >> 3 < len(bitmap) and bool(bitmap[cp >> 3] >> (cp & 7) & 1)
+
+
+def get_coverage_count(bitmap: bytes) -> int:
+    """Get the number of codepoints in a coverage bitmap."""
+    return int.from_bytes(bitmap, "little").bit_count()
+
+
+def _count_bits(bitmap: bytes, start: int, end: int) -> int:
+    if start >> 3 >= len(bitmap):
+        return 0
+    chunk = int.from_bytes(bitmap[start >> 3:(end >> 3) + 1], "little") >> (start & 7)
+    return (chunk & ((1 << (end - start + 1)) - 1)).bit_count()
+
+
+def get_block_coverage(coverage, block_start: int, block_end: int) -> float:
+    """Get coverage percentage for a Unicode block.
+
+    *coverage* is a bitmap from get_font_coverage() or a set of codepoints.
+    """
     total = block_end - block_start + 1
-    if total == 0:
+    if total <= 0:
         return 0.0
-    covered = sum(1 for cp in range(block_start, block_end + 1) if cp in supported)
+    if not isinstance(coverage, (set, frozenset)):
+        return _count_bits(coverage, block_start, block_end) / total * 100
+    # Walk whichever side is smaller: the set, or the block's range
+    if len(coverage) < total:
+        covered = sum(1 for cp in coverage if block_start <= cp <= block_end)
+    else:
+        covered = len(coverage.intersection(range(block_start, block_end + 1)))
     return covered / total * 100
 
 
-def get_language_coverage(supported: set[int], language: str) -> tuple[float, list[str]]:
+def get_all_block_coverage(bitmap: bytes) -> dict[str, float]:
+    """Get coverage percentages for every block in UNICODE_BLOCKS."""
+    return {
+        name: _count_bits(bitmap, start, end) / (end - start + 1) * 100
+        for name, start, end in zip(BLOCK_NAMES, BLOCK_STARTS, BLOCK_ENDS)
+    }
+
+
+def get_language_coverage(bitmap: bytes, language: str, *,
+                          return_missing: bool = True) -> tuple[float, list[str]]:
     """Check if a font covers all characters for a language.
 
-    Returns (coverage_percent, list_of_missing_chars).
+    Returns (coverage_percent, list_of_missing_chars).  The list is sorted
+    by codepoint, and left empty when *return_missing* is false.
     """
-    chars = LANGUAGE_CHARS.get(language, "")
-    if not chars:
+    if language not in LANGUAGE_CP:
         return 0.0, []
+    cps = LANGUAGE_CP[language]
 
-    unique_chars = set(chars)
-    missing = [ch for ch in unique_chars if ord(ch) not in supported]
-    total = len(unique_chars)
-    if total == 0:
-        return 100.0, []
-    coverage = (total - len(missing)) / total * 100
-    return coverage, sorted(missing)
+    size = len(bitmap)
+    missing = [cp for cp in cps if cp >> 3 >= size or not bitmap[cp >> 3] >> (cp & 7) & 1]
+    coverage = (len(cps) - len(missing)) / len(cps) * 100
+    if not return_missing:
+        return coverage, []
+    # LANGUAGE_CP is sorted, so missing already is too
+    return coverage, list(map(chr, missing))
@@ -6,9 +6,10 @@
 """Main application window."""
 
 import csv
-import gettext
+import functools
 import json
 import os
+import sys
 import threading
 from datetime import datetime as _dt_now
 
@@ -18,35 +19,127 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 gi.require_version("Pango", "1.0")
 
-from gi.repository import Gtk, Adw, Gio, GLib, Pango
+from gi.repository import Gtk, Adw, Gio, GLib, GObject, Pango
 
 from .font_utils import (
+    CACHE_DIR,
     FontInfo,
-    get_installed_fonts,
+    get_installed_fonts_async,
+    fontconfig_stamp,
+    get_font_details,
     get_font_coverage,
-    get_block_coverage,
+    get_coverage_count,
+    get_all_block_coverage,
     get_language_coverage,
-    UNICODE_BLOCKS,
+    prefetch_coverage,
+    normalize_search,
     LANGUAGE_CHARS,
 )
-
-_ = gettext.gettext
+from .main import _
 
 FAVORITES_FILE = os.path.expanduser("~/.config/font-preview/favorites.json")
+FONTLIST_FILE = os.path.join(CACHE_DIR, "fontlist.json")
+
+
+# The favorites as last read from or written to FAVORITES_FILE
+_favorites_on_disk: frozenset[str] = frozenset()
 
 
 def _load_favorites() -> set[str]:
+    global _favorites_on_disk
     try:
         with open(FAVORITES_FILE) as f:
-            return set(json.load(f))
+            favs = {sys.intern(family) for family in json.load(f)}
     except Exception:
         return set()
+    _favorites_on_disk = frozenset(favs)
+    return favs
 
 
 def _save_favorites(favs: set[str]):
+    """Write the favorites, atomically, unless the file already has them."""
+    global _favorites_on_disk
+    if favs == _favorites_on_disk:
+        return
     os.makedirs(os.path.dirname(FAVORITES_FILE), exist_ok=True)
-    with open(FAVORITES_FILE, "w") as f:
+    tmp = FAVORITES_FILE + ".tmp"
+    with open(tmp, "w") as f:
         json.dump(sorted(favs), f)
+    os.replace(tmp, FAVORITES_FILE)
+    _favorites_on_disk = frozenset(favs)
+
+
+def _load_font_list(stamp: tuple[int, ...]) -> list[FontInfo]:
+    """Load the font list saved by a previous run if fontconfig is unchanged."""
+    try:
+        with open(FONTLIST_FILE) as f:
+            data = json.load(f)
+        if tuple(data["stamp"]) == stamp:
+            return [FontInfo(*fields) for fields in data["fonts"]]
+    except Exception:
+        pass
+    return []
+
+
+def _save_font_list(stamp: tuple[int, ...], fonts: list[FontInfo]):
+    data = {
+        "stamp": stamp,
+        "fonts": [(f.family, f.style, f.path, f.weight, f.slant, f.width) for f in fonts],
+    }
+    tmp = FONTLIST_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(FONTLIST_FILE), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, FONTLIST_FILE)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _coverage_cached(path: str, mtime: int) -> bytes:
+    return get_font_coverage(path)
+
+
+def _font_coverage(path: str) -> bytes:
+    """Get a font's coverage bitmap, memoized per (path, mtime)."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return b""
+    return _coverage_cached(path, mtime)
+
+
+@functools.lru_cache(maxsize=256)
+def _font_attrs(family: str, size: int) -> Pango.AttrList:
+    """Get the attributes that render a label in *family* at *size* points."""
+    desc = Pango.FontDescription.new()
+    desc.set_family(family)
+    desc.set_size(size * Pango.SCALE)
+    attrs = Pango.AttrList.new()
+    attrs.insert(Pango.attr_font_desc_new(desc))
+    return attrs
+
+
+# Attributes for the metadata tab's key labels
+_BOLD_ATTRS = Pango.AttrList.new()
+_BOLD_ATTRS.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+
+
+class FontItem(GObject.Object):
+    """Font list model item wrapping a FontInfo."""
+
+    __gtype_name__ = "FontPreviewFontItem"
+
+    # FontInfo.search_key, matched by the sidebar's search filter
+    search_text = GObject.Property(type=str)
+    # Mirrors font.favorite; the row's star is bound to it
+    favorite = GObject.Property(type=bool, default=False)
+
+    def __init__(self, font: FontInfo):
+        super().__init__(search_text=font.search_key,
+                         favorite=font.favorite)
+        self.font = font
 
 
 class FontPreviewWindow(Adw.ApplicationWindow):
@@ -58,9 +151,21 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         self.set_default_size(1100, 750)
 
         self._fonts: list[FontInfo] = []
-        self._filtered_fonts: list[FontInfo] = []
+        self._family_items: dict[str, list[FontItem]] = {}
         self._favorites: set[str] = _load_favorites()
-        self._compare_fonts: list[FontInfo] = []
+        # Compared fonts by path, oldest first
+        self._compare_fonts: dict[str, FontInfo] = {}
+        self._search_source = 0
+        self._preview_source = 0
+        # (path, style) -> (weight, slant, width) as fc-query reported them;
+        # kept across refreshes, which replace the FontInfo objects
+        self._font_details: dict[tuple[str, str], tuple[str, str, str]] = {}
+        # Labels showing the preview text, kept so typing only updates them
+        self._preview_labels: list[tuple[int, Gtk.Label]] = []
+        self._compare_labels: list[Gtk.Label] = []
+        # The selected font, and which font each lazily filled tab shows
+        self._pending_font: FontInfo | None = None
+        self._rendered_pages: dict[int, FontInfo] = {}
         self._preview_text = _("The quick brown fox jumps over the lazy dog. 0123456789")
 
         self._build_ui()
@@ -87,7 +192,9 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         self._search_entry.set_margin_end(6)
         self._search_entry.set_margin_top(6)
         self._search_entry.set_margin_bottom(6)
-        self._search_entry.connect("search-changed", self._on_search_changed)
+        # Coalesced in _on_search_changed rather than by the entry's own delay
+        self._search_entry.set_search_delay(0)
+        self._search_entry.connect("changed", self._on_search_changed)
         sidebar_box.append(self._search_entry)
 
         # Filter: All / Favorites
@@ -98,14 +205,30 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         self._filter_dropdown.connect("notify::selected", self._on_filter_changed)
         sidebar_box.append(self._filter_dropdown)
 
-        # Font list
+        # Font list: a ListView only creates widgets for the visible rows,
+        # and the FilterListModel only signals the rows a filter change affects
         scroll = Gtk.ScrolledWindow()
         scroll.set_vexpand(True)
         scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        self._font_listbox = Gtk.ListBox()
-        self._font_listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self._font_listbox.connect("row-selected", self._on_font_selected)
-        scroll.set_child(self._font_listbox)
+        self._font_store = Gio.ListStore(item_type=FontItem)
+        self._search_filter = Gtk.StringFilter(
+            expression=Gtk.PropertyExpression.new(FontItem, None, "search-text"),
+            match_mode=Gtk.StringFilterMatchMode.SUBSTRING, ignore_case=False)
+        # A BoolFilter reads the property in C; no Python callback per row
+        self._fav_filter = Gtk.BoolFilter(
+            expression=Gtk.PropertyExpression.new(FontItem, None, "favorite"))
+        self._font_filter = Gtk.EveryFilter()
+        self._font_filter.append(self._search_filter)
+        self._filter_model = Gtk.FilterListModel(model=self._font_store,
+                                                 filter=self._font_filter)
+        self._font_selection = Gtk.SingleSelection(model=self._filter_model,
+                                                   autoselect=False, can_unselect=True)
+        self._font_selection.connect("notify::selected-item", self._on_font_selected)
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_font_row_setup)
+        factory.connect("bind", self._on_font_row_bind)
+        self._font_list = Gtk.ListView(model=self._font_selection, factory=factory)
+        scroll.set_child(self._font_list)
         sidebar_box.append(scroll)
 
         self._split.set_sidebar(sidebar_box)
@@ -220,6 +343,7 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         self._compare_scroll.set_child(self._compare_box)
         self._notebook.append_page(self._compare_scroll, Gtk.Label(label=_("Compare")))
 
+        self._notebook.connect("switch-page", self._on_tab_switched)
         content_box.append(self._notebook)
         self._split.set_content(content_box)
 
@@ -234,63 +358,85 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         _outer.append(self._status_bar)
         self.set_content(_outer)
 
-    def _load_fonts(self):
-        """Load fonts in background thread."""
-        def _do_load():
-            fonts = get_installed_fonts()
-            for f in fonts:
-                f.favorite = f.family in self._favorites
-            GLib.idle_add(self._fonts_loaded, fonts)
+    def _load_fonts(self, force=False):
+        """Load fonts, from the previous run's list if fontconfig is unchanged.
 
-        threading.Thread(target=_do_load, daemon=True).start()
+        Otherwise fc-list runs and is parsed in a child process.
+        """
+        stamp = fontconfig_stamp()
+        fonts = [] if force else _load_font_list(stamp)
+        if fonts:
+            self._fonts_loaded(fonts)
+            self._prefetch_coverage(fonts)
+            return
+
+        future = get_installed_fonts_async()
+        future.add_done_callback(
+            lambda fut: GLib.idle_add(self._on_fonts_listed, stamp, fut))
+
+    def _on_fonts_listed(self, stamp, future):
+        try:
+            fonts = future.result()
+        except Exception:
+            fonts = []
+        self._fonts_loaded(fonts)
+        if fonts:
+            threading.Thread(target=_save_font_list, args=(stamp, fonts), daemon=True).start()
+            self._prefetch_coverage(fonts)
+        return GLib.SOURCE_REMOVE
+
+    def _prefetch_coverage(self, fonts: list[FontInfo]):
+        # Warm the coverage cache so selecting a font is instant
+        paths = [f.path for f in fonts]
+        threading.Thread(target=prefetch_coverage, args=(paths,), daemon=True).start()
+
+    def _on_refresh(self, _btn):
+        self._load_fonts(force=True)
 
     def _fonts_loaded(self, fonts: list[FontInfo]):
         self._update_status_bar()
         self._fonts = fonts
-        self._apply_filter()
-
-    def _apply_filter(self):
-        query = self._search_entry.get_text().lower().strip()
-        show_favs = self._filter_dropdown.get_selected() == 1
-
-        self._filtered_fonts = []
-        for f in self._fonts:
-            if show_favs and not f.favorite:
-                continue
-            if query and query not in f.family.lower() and query not in f.style.lower():
-                continue
-            self._filtered_fonts.append(f)
-
-        self._populate_list()
-
-    def _populate_list(self):
-        # Clear
-        while True:
-            row = self._font_listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self._font_listbox.remove(row)
-
-        for font in self._filtered_fonts:
-            row = Gtk.ListBoxRow()
-            box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-            box.set_margin_start(6)
-            box.set_margin_end(6)
-            box.set_margin_top(3)
-            box.set_margin_bottom(3)
-
-            if font.favorite:
-                star = Gtk.Image.new_from_icon_name("starred-symbolic")
-                box.append(star)
-
-            label = Gtk.Label(label=font.display_name, xalign=0)
-            label.set_ellipsize(Pango.EllipsizeMode.END)
-            label.set_hexpand(True)
-            box.append(label)
-
-            row.set_child(box)
-            row._font_info = font
-            self._font_listbox.append(row)
+        items = []
+        self._family_items = {}
+        for f in fonts:
+            # Interned like the favorites, so lookups compare by identity
+            f.family = sys.intern(f.family)
+            item = FontItem(f)
+            items.append(item)
+            self._family_items.setdefault(f.family, []).append(item)
+        # Fonts arrive unmarked; only families that are favorites need a pass
+        for family in self._favorites & self._family_items.keys():
+            for item in self._family_items[family]:
+                item.font.favorite = item.favorite = True
+        self._font_store.splice(0, self._font_store.get_n_items(), items)
+
+    def _on_font_row_setup(self, _factory, list_item):
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        box.set_margin_start(6)
+        box.set_margin_end(6)
+        box.set_margin_top(3)
+        box.set_margin_bottom(3)
+
+        star = Gtk.Image.new_from_icon_name("starred-symbolic")
+        item_expr = Gtk.PropertyExpression.new(Gtk.ListItem, None, "item")
+        Gtk.PropertyExpression.new(FontItem, item_expr, "favorite").bind(
+            star, "visible", list_item)
+        box.append(star)
+
+        label = Gtk.Label(xalign=0)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        label.set_hexpand(True)
+        box.append(label)
+
+        list_item.set_child(box)
+
+    def _on_font_row_bind(self, _factory, list_item):
+        font = list_item.get_item().font
+        list_item.get_child().get_last_child().set_label(font.display_name)
+
+    def _selected_font(self):
+        item = self._font_selection.get_selected_item()
+        return item.font if item else None
 
     def _on_export_clicked(self, *_args):
         dialog = Adw.MessageDialog(transient_for=self,
@@ -316,12 +462,24 @@ class FontPreviewWindow(Adw.ApplicationWindow):
             path = dialog.save_finish(result).get_path()
         except Exception:
             return
+        # The font list is loaded without weight/slant/width; export them all.
+        # fc-list runs in a child process so the window stays responsive.
+        fmt = self._export_fmt
+        future = get_installed_fonts_async(details=True)
+        future.add_done_callback(
+            lambda fut: GLib.idle_add(self._write_export, path, fmt, fut))
+
+    def _write_export(self, path, fmt, future):
+        try:
+            fonts = future.result()
+        except Exception:
+            fonts = []
         data = [{"family": f.family, "style": f.style, "path": f.path,
                  "weight": f.weight, "slant": f.slant, "width": f.width}
-                for f in self._fonts]
+                for f in fonts]
         if not data:
-            return
-        if self._export_fmt == "csv":
+            return GLib.SOURCE_REMOVE
+        if fmt == "csv":
             with open(path, "w", newline="", encoding="utf-8") as f:
                 w = csv.DictWriter(f, fieldnames=data[0].keys())
                 w.writeheader()
@@ -329,57 +487,95 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         else:
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+        return GLib.SOURCE_REMOVE
 
     def _on_search_changed(self, entry):
-        self._apply_filter()
+        # Only the last keystroke of a burst refilters
+        if self._search_source:
+            GLib.source_remove(self._search_source)
+        self._search_source = GLib.timeout_add(120, self._do_search, entry.get_text())
 
-    def _on_filter_changed(self, dropdown, _pspec):
-        self._apply_filter()
+    def _do_search(self, text: str):
+        self._search_source = 0
+        # Keys are normalized up front, so the filter compares them as-is
+        self._search_filter.set_search(normalize_search(text.strip()))
+        return GLib.SOURCE_REMOVE
 
-    def _on_font_selected(self, listbox, row):
-        if row is None:
+    def _on_filter_changed(self, dropdown, _pspec):
+        show_favs = dropdown.get_selected() == 1
+        # The favorites filter sits after the search filter when active
+        if show_favs and self._font_filter.get_n_items() == 1:
+            self._font_filter.append(self._fav_filter)
+        elif not show_favs and self._font_filter.get_n_items() == 2:
+            self._font_filter.remove(1)
+
+    def _on_font_selected(self, selection, _pspec):
+        font = self._selected_font()
+        if font is None:
             return
-        font = row._font_info
         self._title_label.set_label(font.display_name)
 
         if self._compare_btn.get_active():
-            if len(self._compare_fonts) >= 4:
-                self._compare_fonts.pop(0)
             # Avoid duplicates
-            if not any(f.path == font.path for f in self._compare_fonts):
-                self._compare_fonts.append(font)
+            if font.path not in self._compare_fonts:
+                if len(self._compare_fonts) >= 4:
+                    del self._compare_fonts[next(iter(self._compare_fonts))]
+                self._compare_fonts[font.path] = font
             self._update_compare()
             self._notebook.set_current_page(4)
         else:
             self._update_preview(font)
+            self._pending_font = font
+            self._update_page(self._notebook.get_current_page())
+
+    def _on_tab_switched(self, _notebook, _page, page_num):
+        self._update_page(page_num)
+
+    def _update_page(self, page_num: int):
+        """Fill a coverage or metadata tab for the selected font when shown."""
+        font = self._pending_font
+        if font is None or self._rendered_pages.get(page_num) is font:
+            return
+        if page_num in (1, 2):
+            # Both coverage tabs come from the same load
+            self._rendered_pages[1] = self._rendered_pages[2] = font
             self._update_coverage(font)
-            self._update_lang_coverage(font)
+        elif page_num == 3:
+            self._rendered_pages[3] = font
             self._update_metadata(font)
 
     def _on_preview_text_changed(self, entry):
-        self._preview_text = entry.get_text()
-        row = self._font_listbox.get_selected_row()
-        if row:
-            self._update_preview(row._font_info)
-        if self._compare_fonts:
-            self._update_compare()
+        # Same coalescing as the search entry: only the last keystroke applies
+        if self._preview_source:
+            GLib.source_remove(self._preview_source)
+        self._preview_source = GLib.timeout_add(80, self._apply_preview_text, entry.get_text())
+
+    def _apply_preview_text(self, text: str):
+        self._preview_source = 0
+        self._preview_text = text
+        for _size, label in self._preview_labels:
+            label.set_text(text)
+        for label in self._compare_labels:
+            label.set_text(text)
+        return GLib.SOURCE_REMOVE
 
     def _on_toggle_favorite(self, btn):
-        row = self._font_listbox.get_selected_row()
-        if not row:
+        font = self._selected_font()
+        if not font:
             return
-        font = row._font_info
-        if font.family in self._favorites:
-            self._favorites.discard(font.family)
-            font.favorite = False
-        else:
+        favorite = font.family not in self._favorites
+        if favorite:
             self._favorites.add(font.family)
-            font.favorite = True
+        else:
+            self._favorites.discard(font.family)
         _save_favorites(self._favorites)
-        # Mark all fonts with same family
-        for f in self._fonts:
-            f.favorite = f.family in self._favorites
-        self._apply_filter()
+        # Mark all fonts with same family; their rows' stars follow
+        for item in self._family_items.get(font.family, ()):
+            item.font.favorite = favorite
+            item.favorite = favorite
+        if self._filter_dropdown.get_selected() == 1:
+            self._fav_filter.changed(Gtk.FilterChange.LESS_STRICT if favorite
+                                     else Gtk.FilterChange.MORE_STRICT)
 
     def _on_compare_toggled(self, btn):
         if not btn.get_active():
@@ -387,130 +583,138 @@ class FontPreviewWindow(Adw.ApplicationWindow):
             self._clear_box(self._compare_box)
 
     def _clear_box(self, box):
-        while True:
-            child = box.get_first_child()
-            if child is None:
-                break
+        # Gtk.Box has no remove_all(); removing from the tail avoids relinking
+        # the remaining siblings on every removal
+        while (child := box.get_last_child()) is not None:
             box.remove(child)
 
     def _update_preview(self, font: FontInfo):
-        self._clear_box(self._preview_box)
-
-        sizes = [12, 18, 24, 36, 48, 72]
-        for size in sizes:
-            label = Gtk.Label(xalign=0, wrap=True)
-            label.set_markup(
-                f'<span font_desc="{GLib.markup_escape_text(font.family)} {size}">'
-                f'{GLib.markup_escape_text(self._preview_text)}</span>'
-            )
-            size_lbl = Gtk.Label(label=f"{size}px", xalign=0)
-            size_lbl.add_css_class("dim-label")
-            self._preview_box.append(size_lbl)
-            self._preview_box.append(label)
-            self._preview_box.append(Gtk.Separator())
+        # The rows are built once; switching fonts only swaps attributes
+        if not self._preview_labels:
+            sizes = [12, 18, 24, 36, 48, 72]
+            for size in sizes:
+                label = Gtk.Label(label=self._preview_text, xalign=0, wrap=True)
+                size_lbl = Gtk.Label(label=f"{size}px", xalign=0)
+                size_lbl.add_css_class("dim-label")
+                self._preview_box.append(size_lbl)
+                self._preview_box.append(label)
+                self._preview_box.append(Gtk.Separator())
+                self._preview_labels.append((size, label))
+
+        for size, label in self._preview_labels:
+            label.set_attributes(_font_attrs(font.family, size))
+
+    @staticmethod
+    def _make_tab_box(title: str) -> Gtk.Box:
+        """Create a detached tab page box, headed by *title*."""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        box.set_margin_start(12)
+        box.set_margin_top(12)
+        box.set_margin_end(12)
+        box.set_margin_bottom(12)
+        title_label = Gtk.Label(label=title, xalign=0)
+        title_label.add_css_class("title-3")
+        box.append(title_label)
+        return box
 
     def _update_coverage(self, font: FontInfo):
-        self._clear_box(self._coverage_box)
+        """Fill the Unicode and language coverage tabs for *font*.
+
+        One thread reads the coverage and computes both tabs' numbers.
+        """
+        for scroll, title in ((self._coverage_scroll, _("Unicode Block Coverage")),
+                              (self._lang_scroll, _("Language Coverage"))):
+            box = self._make_tab_box(title)
+            spinner = Gtk.Spinner()
+            spinner.start()
+            box.append(spinner)
+            scroll.set_child(box)
 
-        title = Gtk.Label(label=_("Unicode Block Coverage"), xalign=0)
-        title.add_css_class("title-3")
-        self._coverage_box.append(title)
-
-        def _load_coverage():
-            supported = get_font_coverage(font.path)
-            GLib.idle_add(_show_coverage, supported)
-
-        def _show_coverage(supported):
-            # Remove spinner if any
-            self._clear_box(self._coverage_box)
-            title2 = Gtk.Label(label=_("Unicode Block Coverage"), xalign=0)
-            title2.add_css_class("title-3")
-            self._coverage_box.append(title2)
-
-            total_label = Gtk.Label(
-                label=_("Total glyphs: %d") % len(supported), xalign=0
-            )
-            self._coverage_box.append(total_label)
-            self._coverage_box.append(Gtk.Separator())
-
-            for block_name, (start, end) in sorted(UNICODE_BLOCKS.items()):
-                pct = get_block_coverage(supported, start, end)
-                if pct == 0:
-                    continue
-                row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-                name_label = Gtk.Label(label=block_name, xalign=0)
-                name_label.set_hexpand(True)
-                name_label.set_size_request(200, -1)
-                row.append(name_label)
-
-                bar = Gtk.ProgressBar()
-                bar.set_fraction(pct / 100)
-                bar.set_hexpand(True)
-                bar.set_valign(Gtk.Align.CENTER)
-                row.append(bar)
-
-                pct_label = Gtk.Label(label=f"{pct:.0f}%", xalign=1)
-                pct_label.set_size_request(50, -1)
-                row.append(pct_label)
-
-                self._coverage_box.append(row)
+        def _load():
+            supported = _font_coverage(font.path)
+            # Percentages are computed here; the idle callback only builds rows
+            blocks = [(name, pct) for name, pct
+                      in sorted(get_all_block_coverage(supported).items()) if pct]
+            langs = [(lang, *get_language_coverage(supported, lang))
+                     for lang in sorted(LANGUAGE_CHARS.keys())]
+            GLib.idle_add(self._show_coverage, font, get_coverage_count(supported),
+                          blocks, langs)
 
-        spinner = Gtk.Spinner()
-        spinner.start()
-        self._coverage_box.append(spinner)
-        threading.Thread(target=_load_coverage, daemon=True).start()
+        threading.Thread(target=_load, daemon=True).start()
 
-    def _update_lang_coverage(self, font: FontInfo):
-        self._clear_box(self._lang_box)
+    def _show_coverage(self, font: FontInfo, count: int, blocks, langs):
+        # A later selection's results win over this one's
+        if font is not self._pending_font:
+            # The tabs still show the spinner; let them load again for *font*
+            if self._rendered_pages.get(1) is font:
+                del self._rendered_pages[1], self._rendered_pages[2]
+            return GLib.SOURCE_REMOVE
 
-        title = Gtk.Label(label=_("Language Coverage"), xalign=0)
-        title.add_css_class("title-3")
-        self._lang_box.append(title)
+        # Fill detached boxes and swap them in, so each tab is laid out once
+        box = self._make_tab_box(_("Unicode Block Coverage"))
 
-        def _load():
-            supported = get_font_coverage(font.path)
-            GLib.idle_add(_show, supported)
-
-        def _show(supported):
-            self._clear_box(self._lang_box)
-            title2 = Gtk.Label(label=_("Language Coverage"), xalign=0)
-            title2.add_css_class("title-3")
-            self._lang_box.append(title2)
-
-            for lang in sorted(LANGUAGE_CHARS.keys()):
-                pct, missing = get_language_coverage(supported, lang)
-                row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-
-                name_label = Gtk.Label(label=lang, xalign=0)
-                name_label.set_hexpand(True)
-                name_label.set_size_request(180, -1)
-                row.append(name_label)
-
-                bar = Gtk.ProgressBar()
-                bar.set_fraction(pct / 100)
-                bar.set_hexpand(True)
-                bar.set_valign(Gtk.Align.CENTER)
-                row.append(bar)
-
-                pct_label = Gtk.Label(label=f"{pct:.0f}%", xalign=1)
-                pct_label.set_size_request(50, -1)
-                row.append(pct_label)
-
-                self._lang_box.append(row)
-
-                if missing and len(missing) <= 20:
-                    miss_str = " ".join(missing)
-                    miss_label = Gtk.Label(
-                        label=_("Missing: %s") % miss_str, xalign=0
-                    )
-                    miss_label.add_css_class("dim-label")
-                    miss_label.set_margin_start(12)
-                    self._lang_box.append(miss_label)
+        total_label = Gtk.Label(
+            label=_("Total glyphs: %d") % count, xalign=0
+        )
+        box.append(total_label)
+        box.append(Gtk.Separator())
 
-        spinner = Gtk.Spinner()
-        spinner.start()
-        self._lang_box.append(spinner)
-        threading.Thread(target=_load, daemon=True).start()
+        for block_name, pct in blocks:
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+            name_label = Gtk.Label(label=block_name, xalign=0)
+            name_label.set_hexpand(True)
+            name_label.set_size_request(200, -1)
+            row.append(name_label)
+
+            bar = Gtk.ProgressBar()
+            bar.set_fraction(pct / 100)
+            bar.set_hexpand(True)
+            bar.set_valign(Gtk.Align.CENTER)
+            row.append(bar)
+
+            pct_label = Gtk.Label(label=f"{pct:.0f}%", xalign=1)
+            pct_label.set_size_request(50, -1)
+            row.append(pct_label)
+
+            box.append(row)
+
+        self._coverage_box = box
+        self._coverage_scroll.set_child(box)
+
+        box = self._make_tab_box(_("Language Coverage"))
+
+        for lang, pct, missing in langs:
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+
+            name_label = Gtk.Label(label=lang, xalign=0)
+            name_label.set_hexpand(True)
+            name_label.set_size_request(180, -1)
+            row.append(name_label)
+
+            bar = Gtk.ProgressBar()
+            bar.set_fraction(pct / 100)
+            bar.set_hexpand(True)
+            bar.set_valign(Gtk.Align.CENTER)
+            row.append(bar)
+
+            pct_label = Gtk.Label(label=f"{pct:.0f}%", xalign=1)
+            pct_label.set_size_request(50, -1)
+            row.append(pct_label)
+
+            box.append(row)
+
+            if missing and len(missing) <= 20:
+                miss_str = " ".join(missing)
+                miss_label = Gtk.Label(
+                    label=_("Missing: %s") % miss_str, xalign=0
+                )
+                miss_label.add_css_class("dim-label")
+                miss_label.set_margin_start(12)
+                box.append(miss_label)
+
+        self._lang_box = box
+        self._lang_scroll.set_child(box)
+        return GLib.SOURCE_REMOVE
 
     def _update_metadata(self, font: FontInfo):
         self._clear_box(self._meta_box)
@@ -519,6 +723,37 @@ class FontPreviewWindow(Adw.ApplicationWindow):
         title.add_css_class("title-3")
         self._meta_box.append(title)
 
+        details = self._font_details.get((font.path, font.style))
+        if details is not None:
+            font.weight, font.slant, font.width = details
+        if font.weight or details is not None:
+            self._show_metadata(font)
+            return
+
+        # fc-query can be slow; ask it once per font, off the main thread
+        def _load():
+            details = get_font_details(font.path, font.style)
+            GLib.idle_add(self._details_loaded, font, details)
+
+        spinner = Gtk.Spinner()
+        spinner.start()
+        self._meta_box.append(spinner)
+        threading.Thread(target=_load, daemon=True).start()
+
+    def _details_loaded(self, font: FontInfo, details: tuple[str, str, str]):
+        self._font_details[font.path, font.style] = details
+        font.weight, font.slant, font.width = details
+        # Unless the tab has moved on to another font, it waits on this one
+        if self._rendered_pages.get(3) is font:
+            self._show_metadata(font)
+        return GLib.SOURCE_REMOVE
+
+    def _show_metadata(self, font: FontInfo):
+        # Drop the spinner, if any, below the title
+        title = self._meta_box.get_first_child()
+        while (child := self._meta_box.get_last_child()) is not title:
+            self._meta_box.remove(child)
+
         fields = [
             (_("Family"), font.family),
             (_("Style"), font.style),
@@ -532,7 +767,8 @@ class FontPreviewWindow(Adw.ApplicationWindow):
             if not value:
                 continue
             row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-            key = Gtk.Label(label=f"<b>{GLib.markup_escape_text(label_text)}:</b>", use_markup=True, xalign=0)
+            key = Gtk.Label(label=f"{label_text}:", xalign=0)
+            key.set_attributes(_BOLD_ATTRS)
             key.set_size_request(100, -1)
             row.append(key)
             val = Gtk.Label(label=value, xalign=0, selectable=True, wrap=True)
@@ -542,6 +778,7 @@ class FontPreviewWindow(Adw.ApplicationWindow):
 
     def _update_compare(self):
         self._clear_box(self._compare_box)
+        self._compare_labels = []
 
         if not self._compare_fonts:
             lbl = Gtk.Label(label=_("Select 2–4 fonts to compare"))
@@ -562,7 +799,7 @@ class FontPreviewWindow(Adw.ApplicationWindow):
 
         self._compare_box.append(Gtk.Separator())
 
-        for font in self._compare_fonts:
+        for font in self._compare_fonts.values():
             frame = Gtk.Frame()
             vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
             vbox.set_margin_start(12)
@@ -574,11 +811,9 @@ class FontPreviewWindow(Adw.ApplicationWindow):
             name.add_css_class("title-4")
             vbox.append(name)
 
-            preview = Gtk.Label(xalign=0, wrap=True)
-            preview.set_markup(
-                f'<span font_desc="{GLib.markup_escape_text(font.family)} 24">'
-                f'{GLib.markup_escape_text(self._preview_text)}</span>'
-            )
+            preview = Gtk.Label(label=self._preview_text, xalign=0, wrap=True)
+            preview.set_attributes(_font_attrs(font.family, 24))
+            self._compare_labels.append(preview)
             vbox.append(preview)
 
             frame.set_child(vbox)
@@ -0,0 +1,120 @@
+# Font Preview - A better font viewer for Linux
+# Copyright (C) 2025 Daniel Nylander <daniel@danielnylander.se>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Compare the sfnt cmap reader in font_utils against fontTools."""
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
+
+from font_preview.font_utils import _read_cmap_ranges
+
+NUM_GLYPHS = 40
+
+
+def _build_font(path, mapping, extra_subtables=()):
+    """Write a TrueType font mapping codepoints to glyph names."""
+    glyph_order = [".notdef"] + [f"g{i}" for i in range(1, NUM_GLYPHS)]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap(mapping)
+    pen = TTGlyphPen(None)
+    fb.setupGlyf({name: pen.glyph() for name in glyph_order})
+    fb.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupOS2()
+    fb.setupPost()
+    if extra_subtables:
+        fb.font["cmap"].tables.extend(extra_subtables)
+    fb.save(str(path))
+
+
+def _subtable(fmt, platform_id, encoding_id, mapping):
+    table = CmapSubtable.newSubtable(fmt)
+    table.platformID = platform_id
+    table.platEncID = encoding_id
+    table.language = 0
+    table.cmap = mapping
+    return table
+
+
+def _reference(path):
+    """Codepoints fontTools maps to a glyph other than .notdef."""
+    cmap = TTFont(str(path)).getBestCmap() or {}
+    return {cp for cp, name in cmap.items() if name != ".notdef"}
+
+
+def _covered(ranges):
+    return {cp for start, end in ranges for cp in range(start, end + 1)}
+
+
+def test_format4_delta_and_range_offset(tmp_path):
+    path = tmp_path / "f4.ttf"
+    mapping = {}
+    # Consecutive glyph ids: encoded with idDelta, idRangeOffset == 0
+    for i, cp in enumerate(range(0x41, 0x41 + 10)):
+        mapping[cp] = f"g{i + 1}"
+    # Scattered glyph ids: encoded through glyphIdArray via idRangeOffset
+    for i, cp in enumerate(range(0x430, 0x430 + 8)):
+        mapping[cp] = f"g{(i * 7) % (NUM_GLYPHS - 1) + 1}"
+    _build_font(path, mapping)
+
+    font = TTFont(str(path))
+    table = font["cmap"].getcmap(3, 1)
+    assert table.format == 4
+    ranges = _read_cmap_ranges(str(path))
+    assert ranges is not None
+    assert _covered(ranges) == _reference(path) == set(mapping)
+
+
+def test_format12(tmp_path):
+    path = tmp_path / "f12.ttf"
+    mapping = {0x20: "g1", 0x1F600: "g2", 0x1F601: "g3", 0x1F603: "g5", 0x20000: "g9"}
+    _build_font(path, mapping)
+
+    assert TTFont(str(path))["cmap"].getcmap(3, 10).format == 12
+    ranges = _read_cmap_ranges(str(path))
+    assert ranges is not None
+    assert _covered(ranges) == _reference(path) == set(mapping)
+
+
+def test_format13(tmp_path):
+    path = tmp_path / "f13.ttf"
+    # Format 13 maps whole ranges to one glyph; (3, 10) is preferred over (3, 1)
+    many_to_one = {cp: "g1" for cp in range(0x2500, 0x2580)}
+    many_to_one.update({cp: "g2" for cp in range(0x10000, 0x10010)})
+    _build_font(path, {0x41: "g3"}, [_subtable(13, 3, 10, many_to_one)])
+
+    assert TTFont(str(path))["cmap"].getcmap(3, 10).format == 13
+    ranges = _read_cmap_ranges(str(path))
+    assert ranges is not None
+    assert _covered(ranges) == _reference(path) == set(many_to_one)
+
+
+def test_notdef_is_not_covered(tmp_path):
+    path = tmp_path / "notdef.ttf"
+    mapping = {0x41: "g1", 0x42: ".notdef", 0x43: "g2"}
+    _build_font(path, mapping)
+
+    ranges = _read_cmap_ranges(str(path))
+    assert _covered(ranges) == _reference(path) == {0x41, 0x43}
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.ttf"
+    path.write_bytes(b"")
+    assert _read_cmap_ranges(str(path)) is None
+
+
+@pytest.mark.parametrize("where", ["header", "directory", "cmap"])
+def test_truncated_file(tmp_path, where):
+    full = tmp_path / "full.ttf"
+    _build_font(full, {cp: f"g{cp - 0x40}" for cp in range(0x41, 0x41 + 20)})
+    cmap_offset = TTFont(str(full)).reader.tables["cmap"].offset
+    keep = {"header": 6, "directory": 20, "cmap": cmap_offset + 20}[where]
+    path = tmp_path / "truncated.ttf"
+    path.write_bytes(full.read_bytes()[:keep])
+    assert _read_cmap_ranges(str(path)) is None